@@ -1,32 +1,111 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
-from pathlib import Path
-import shutil
-import uuid
+from starlette.concurrency import run_in_threadpool
+from typing import List
+import asyncio
 
-from app.services.parser import BedrockResumeParser
+from app.core.config import settings
+from app.services.parser import NOT_A_RESUME, BedrockResumeParser
+from app.services.batch import BedrockBatchResumeParser
 from app.models.resume import ParsedResume
+from app.models.batch import BatchJob, BatchResult, ParseResult
 
 router = APIRouter(prefix="/resume", tags=["Resume Parser"])
 
 parser_service = BedrockResumeParser()
+batch_parser_service = BedrockBatchResumeParser(parser_service)
+
+# Caps in-flight Bedrock calls for this worker only; with N uvicorn workers
+# the account sees up to N x bedrock_max_concurrency. Waiters queue on the
+# event loop, so they never hold one of the threadpool's worker threads.
+bedrock_slots = asyncio.Semaphore(settings.bedrock_max_concurrency)
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    pdf_bytes = await file.read()
+    # Large uploads are spooled to /tmp; release them now rather than
+    # holding them for the whole Bedrock call
+    await file.close()
+    return pdf_bytes
+
+
+async def _parse_bytes(pdf_bytes: bytes):
+    # Both steps are blocking; keep them off the event loop. Only the Bedrock
+    # step takes a slot, so cache hits and rejected uploads never wait
+    prepared, error = await run_in_threadpool(
+        parser_service.prepare_resume, pdf_bytes
+    )
+
+    if error:
+        return None, error
+
+    if prepared.cached is not None:
+        return prepared.cached, None
+
+    async with bedrock_slots:
+        return await run_in_threadpool(parser_service.parse_prepared, prepared)
 
 
 @router.post("/parse", response_model=ParsedResume)
-def parse_resume(file: UploadFile = File(...)):
+async def parse_resume(file: UploadFile = File(...)):
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-    temp_path = Path(f"/tmp/{uuid.uuid4()}.pdf")
-
-    with temp_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    pdf_bytes = await _read_upload(file)
 
-    parsed_resume, error = parser_service.parse_resume(temp_path)
+    parsed_resume, error = await _parse_bytes(pdf_bytes)
 
-    temp_path.unlink(missing_ok=True)
+    if error == NOT_A_RESUME:
+        raise HTTPException(status_code=422, detail=error)
 
     if error:
         raise HTTPException(status_code=400, detail=error)
 
     return parsed_resume
 
+
+@router.post("/parse_many", response_model=List[ParseResult])
+async def parse_resumes(files: List[UploadFile] = File(...)):
+    if len(files) > settings.parse_many_max_files:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                f"At most {settings.parse_many_max_files} files per request; "
+                "use /resume/parse_batch for larger sets"
+            ),
+        )
+
+    if not all(file.filename.endswith(".pdf") for file in files):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+
+    async def parse_one(file: UploadFile) -> ParseResult:
+        parsed_resume, error = await _parse_bytes(await _read_upload(file))
+        return ParseResult(filename=file.filename, resume=parsed_resume, error=error)
+
+    return await asyncio.gather(*(parse_one(file) for file in files))
+
+
+@router.post("/parse_batch", response_model=BatchJob, status_code=202)
+async def parse_resume_batch(files: List[UploadFile] = File(...)):
+    if not all(file.filename.endswith(".pdf") for file in files):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+
+    pdf_files = [(file.filename, await _read_upload(file)) for file in files]
+
+    job, error = await run_in_threadpool(batch_parser_service.submit_batch, pdf_files)
+
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+    return job
+
+
+@router.get("/parse_batch/{job_id}", response_model=BatchResult)
+async def get_resume_batch(job_id: str):
+    result, error = await run_in_threadpool(
+        batch_parser_service.get_batch_result, job_id
+    )
+
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+    return result
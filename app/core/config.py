@@ -1,9 +1,31 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     aws_region: str = "eu-west-2"
     bedrock_model_id: str = "anthropic.claude-3-7-sonnet-20250219-v1:0"
 
+    # Max concurrent on-demand Bedrock calls per worker
+    bedrock_max_concurrency: int = 8
+
+    # Max files accepted by a single /resume/parse_many request
+    parse_many_max_files: int = 20
+
+    # Caps on LLM input (characters of resume text) and output (tokens)
+    max_resume_chars: int = 8000
+    max_output_tokens: int = 4096
+
+    # Max parsed resumes kept in memory per worker; 0 disables the cache
+    parse_cache_size: int = 512
+
+    # Bedrock batch inference
+    batch_s3_bucket: Optional[str] = None
+    batch_s3_prefix: str = "resume-batch"
+    batch_role_arn: Optional[str] = None
+    # Bedrock's minimum records per model invocation job
+    batch_min_records: int = 100
+
     class Config:
         env_file = ".env"
 
@@ -1,11 +1,36 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import router
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from app.api.routes import router, parser_service
+
+# uvicorn only configures its own loggers; give the app's an INFO handler
+app_logger = logging.getLogger("app")
+if not app_logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(levelname)s:     %(name)s - %(message)s")
+    )
+    app_logger.addHandler(handler)
+    app_logger.setLevel(logging.INFO)
+    app_logger.propagate = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(parser_service.warm_up)
+    yield
+
 
 app = FastAPI(
     title="Resume Parser API",
     version="1.0.0",
-    root_path="/proxy/8000"
+    root_path="/proxy/8000",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+from app.models.resume import ParsedResume
+
+
+class BatchJob(BaseModel):
+    job_id: str = Field(min_length=1)
+    status: str
+    # record_id -> uploaded filename
+    records: Dict[str, str] = Field(default_factory=dict)
+    # uploaded filename -> reason it was left out of the job
+    skipped: Dict[str, str] = Field(default_factory=dict)
+
+
+class BatchRecordResult(BaseModel):
+    record_id: str = Field(min_length=1)
+    resume: Optional[ParsedResume] = None
+    error: Optional[str] = None
+
+
+class BatchResult(BaseModel):
+    job_id: str = Field(min_length=1)
+    status: str
+    message: Optional[str] = None
+    results: List[BatchRecordResult] = Field(default_factory=list)
+
+
+class ParseResult(BaseModel):
+    filename: str
+    resume: Optional[ParsedResume] = None
+    error: Optional[str] = None
@@ -1,8 +1,19 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Literal
+import re
+
+
+# Compiled once at import; a cheap shape check rather than full RFC 5322
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Shared by every resume model: ignore unknown keys from the LLM and trim
+# stray whitespace around extracted strings
+MODEL_CONFIG = ConfigDict(extra="ignore", str_strip_whitespace=True)
 
 
 class Education(BaseModel):
+    model_config = MODEL_CONFIG
+
     degree: str = Field(min_length=1)
     institution: str = Field(min_length=1)
     field_of_study: Optional[str] = None
@@ -12,6 +23,8 @@ class Education(BaseModel):
 
 
 class WorkExperience(BaseModel):
+    model_config = MODEL_CONFIG
+
     job_title: str = Field(min_length=1)
     company: str = Field(min_length=1)
     location: Optional[str] = None
@@ -22,6 +35,8 @@ class WorkExperience(BaseModel):
 
 
 class Skill(BaseModel):
+    model_config = MODEL_CONFIG
+
     name: str = Field(min_length=1)
     category: Optional[
         Literal["technical", "soft", "language", "tool", "framework", "other"]
@@ -32,6 +47,8 @@ class Skill(BaseModel):
 
 
 class Certification(BaseModel):
+    model_config = MODEL_CONFIG
+
     name: str = Field(min_length=1)
     issuing_organization: Optional[str] = None
     issue_date: Optional[str] = None
@@ -40,6 +57,8 @@ class Certification(BaseModel):
 
 
 class Project(BaseModel):
+    model_config = MODEL_CONFIG
+
     title: str = Field(min_length=1)
     description: str = Field(min_length=1)
     technologies: List[str] = Field(default_factory=list)
@@ -48,8 +67,10 @@ class Project(BaseModel):
 
 
 class ParsedResume(BaseModel):
+    model_config = MODEL_CONFIG
+
     full_name: str = Field(min_length=1)
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     phone: Optional[str] = None
     location: Optional[str] = None
 
@@ -70,3 +91,13 @@ class ParsedResume(BaseModel):
 
     years_of_experience: Optional[int] = Field(None, ge=0, le=50)
     current_job_title: Optional[str] = None
+
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None and not EMAIL_PATTERN.match(value):
+            raise ValueError("value is not a valid email address")
+        return value
+
+
+ParsedResume.model_rebuild()
@@ -0,0 +1,282 @@
+import json
+import uuid
+from typing import List, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+from pydantic import ValidationError
+
+from app.models.batch import BatchJob, BatchRecordResult, BatchResult
+from app.models.resume import ParsedResume
+from app.core.config import settings
+from app.services.parser import (
+    NOT_A_RESUME,
+    BedrockResumeParser,
+    PdfSource,
+    load_pdf_bytes,
+    looks_like_resume,
+)
+
+
+class BedrockBatchResumeParser:
+    """
+    Bulk resume parser using AWS Bedrock batch inference. Resumes are written
+    to S3 as a JSONL manifest and parsed by a single model invocation job,
+    reusing the on-demand parser's text extraction and prompt.
+    """
+
+    TOOL_NAME = "ParsedResume"
+
+    def __init__(self, parser: BedrockResumeParser):
+        self.parser = parser
+
+        aws_config = Config(
+            region_name=settings.aws_region,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        )
+
+        self.bedrock_client = boto3.client(
+            service_name="bedrock",
+            region_name=settings.aws_region,
+            config=aws_config,
+        )
+        self.s3_client = boto3.client(
+            service_name="s3",
+            region_name=settings.aws_region,
+            config=aws_config,
+        )
+
+        self.model_id = settings.bedrock_model_id
+        self.bucket = settings.batch_s3_bucket
+        self.prefix = settings.batch_s3_prefix.strip("/")
+        self.role_arn = settings.batch_role_arn
+
+    def _create_model_input(self, resume_text: str) -> dict:
+        return {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": settings.max_output_tokens,
+            "system": "Extract structured resume data using tool calls.",
+            "messages": [
+                {
+                    "role": "user",
+                    "content": self.parser._create_prompt(resume_text),
+                },
+            ],
+            "tools": [
+                {
+                    "name": self.TOOL_NAME,
+                    "description": "Structured resume data",
+                    "input_schema": ParsedResume.model_json_schema(),
+                }
+            ],
+            "tool_choice": {"type": "tool", "name": self.TOOL_NAME},
+        }
+
+    def _parse_record(self, line_number: int, line: str) -> BatchRecordResult:
+        # Output lines without a usable recordId are reported by position
+        fallback_id = f"line-{line_number}"
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            return BatchRecordResult(
+                record_id=fallback_id, error=f"Malformed output record: {str(e)}"
+            )
+
+        if not isinstance(record, dict):
+            return BatchRecordResult(
+                record_id=fallback_id, error="Malformed output record"
+            )
+
+        record_id = str(record.get("recordId") or fallback_id)
+
+        if record.get("error"):
+            return BatchRecordResult(
+                record_id=record_id,
+                error=f"Parsing failed: {record['error']}",
+            )
+
+        content = (record.get("modelOutput") or {}).get("content") or []
+        tool_input = next(
+            (
+                block.get("input")
+                for block in content
+                if isinstance(block, dict)
+                and block.get("type") == "tool_use"
+                and block.get("name") == self.TOOL_NAME
+            ),
+            None,
+        )
+
+        if tool_input is None:
+            return BatchRecordResult(
+                record_id=record_id, error="Model returned no tool call"
+            )
+
+        try:
+            resume = ParsedResume.model_validate(tool_input)
+        except ValidationError as e:
+            return BatchRecordResult(
+                record_id=record_id,
+                error=f"Schema validation failed: {str(e)}",
+            )
+
+        return BatchRecordResult(record_id=record_id, resume=resume)
+
+    def submit_batch(
+        self, pdf_files: List[Tuple[str, PdfSource]]
+    ) -> tuple[Optional[BatchJob], Optional[str]]:
+        """
+        Extract text from (filename, PDF path or bytes) pairs and submit them
+        as one Bedrock model invocation job.
+        """
+        if not self.bucket or not self.role_arn:
+            return None, "Batch parsing is not configured"
+
+        records = {}
+        skipped = {}
+        lines = []
+
+        for index, (filename, pdf_source) in enumerate(pdf_files):
+            pdf_bytes = load_pdf_bytes(pdf_source)
+
+            if pdf_bytes is None:
+                skipped[filename] = "Invalid PDF file"
+                continue
+
+            try:
+                resume_text = self.parser.extract_text_from_pdf(pdf_bytes)
+            except Exception as e:
+                skipped[filename] = f"PDF extraction failed: {str(e)}"
+                continue
+
+            if not resume_text or len(resume_text) < 20:
+                skipped[filename] = "Resume text is empty or too short"
+                continue
+
+            if not looks_like_resume(resume_text):
+                skipped[filename] = NOT_A_RESUME
+                continue
+
+            record_id = f"RES{index:08d}"
+            records[record_id] = filename
+            lines.append(
+                json.dumps(
+                    {
+                        "recordId": record_id,
+                        "modelInput": self._create_model_input(resume_text),
+                    }
+                )
+            )
+
+        if not lines:
+            return None, "No resumes with extractable text"
+
+        # Bedrock rejects jobs below its minimum record count; fail before
+        # anything is written to S3
+        if len(lines) < settings.batch_min_records:
+            return None, (
+                f"Batch parsing needs at least {settings.batch_min_records} "
+                f"resumes with extractable text, got {len(lines)}"
+            )
+
+        job_name = f"resume-batch-{uuid.uuid4().hex[:12]}"
+        input_key = f"{self.prefix}/input/{job_name}.jsonl"
+
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket,
+                Key=input_key,
+                Body="\n".join(lines).encode("utf-8"),
+            )
+        except Exception as e:
+            return None, f"Batch submission failed: {str(e)}"
+
+        try:
+            response = self.bedrock_client.create_model_invocation_job(
+                jobName=job_name,
+                roleArn=self.role_arn,
+                modelId=self.model_id,
+                inputDataConfig={
+                    "s3InputDataConfig": {
+                        "s3InputFormat": "JSONL",
+                        "s3Uri": f"s3://{self.bucket}/{input_key}",
+                    }
+                },
+                outputDataConfig={
+                    "s3OutputDataConfig": {
+                        "s3Uri": f"s3://{self.bucket}/{self.prefix}/output/",
+                    }
+                },
+            )
+        except Exception as e:
+            # Don't leave an orphaned manifest behind for a job that never ran
+            try:
+                self.s3_client.delete_object(Bucket=self.bucket, Key=input_key)
+            except Exception:
+                pass
+            return None, f"Batch submission failed: {str(e)}"
+
+        job_id = response["jobArn"].split("/")[-1]
+
+        return (
+            BatchJob(
+                job_id=job_id,
+                status="Submitted",
+                records=records,
+                skipped=skipped,
+            ),
+            None,
+        )
+
+    def get_batch_result(
+        self, job_id: str
+    ) -> tuple[Optional[BatchResult], Optional[str]]:
+        """
+        Fetch the job status and, once completed, the validated resumes from
+        the job's output manifest.
+        """
+        try:
+            job = self.bedrock_client.get_model_invocation_job(
+                jobIdentifier=job_id
+            )
+        except Exception as e:
+            return None, f"Batch lookup failed: {str(e)}"
+
+        status = job["status"]
+
+        if status not in ("Completed", "PartiallyCompleted"):
+            return (
+                BatchResult(job_id=job_id, status=status, message=job.get("message")),
+                None,
+            )
+
+        input_uri = job["inputDataConfig"]["s3InputDataConfig"]["s3Uri"]
+        output_uri = job["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"]
+
+        bucket, _, output_prefix = output_uri.removeprefix("s3://").partition("/")
+        output_key = (
+            f"{output_prefix.rstrip('/')}/{job_id}/{input_uri.split('/')[-1]}.out"
+        )
+
+        try:
+            body = self.s3_client.get_object(Bucket=bucket, Key=output_key)["Body"]
+            output = body.read().decode("utf-8")
+        except Exception as e:
+            return None, f"Batch output could not be read: {str(e)}"
+
+        results = [
+            self._parse_record(line_number, line)
+            for line_number, line in enumerate(output.splitlines(), start=1)
+            if line.strip()
+        ]
+
+        return (
+            BatchResult(
+                job_id=job_id,
+                status=status,
+                message=job.get("message"),
+                results=results,
+            ),
+            None,
+        )
@@ -1,14 +1,123 @@
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Union
 
 import boto3
-import pdfplumber
+import pymupdf
 import instructor
+from botocore.config import Config
 from pydantic import ValidationError
 
 from app.models.resume import ParsedResume
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Plain-text extraction only: never collect images or vector graphics
+TEXT_FLAGS = (
+    pymupdf.TEXTFLAGS_TEXT
+    & ~pymupdf.TEXT_PRESERVE_IMAGES
+    & ~pymupdf.TEXT_COLLECT_VECTORS
+)
+
+PROMPT_HEADER = """You are a resume parsing assistant.
+
+Rules:
+- Be concise and factual
+- Do not infer missing information
+- Limit responsibilities to 3–5 bullets per role
+- Normalize skills and titles where possible
+- Do not add commentary
+
+Resume:
+"""
+
+# A references/acknowledgements section, up to the next line that looks like
+# any heading (a short run of words with no digits or punctuation) or the end
+# of the text. Stopping early on e.g. a referee's name is fine; running past
+# a real section heading is not. Words must be separated by whitespace so a
+# line splits into words only one way (no backtracking blowup on unspaced
+# text)
+NON_INFORMATIVE_SECTION = re.compile(
+    r"^[ \t]*(?:references|referees|acknowledge?ments)[ \t]*:?[ \t]*(?:\n|\Z)"
+    r"(?:(?![ \t]*[A-Za-z&/]+(?:[ \t]+[A-Za-z&/]+){0,3}[ \t]*:?[ \t]*$)"
+    r".*(?:\n|\Z))*",
+    re.IGNORECASE | re.MULTILINE,
+)
+REFERENCES_ON_REQUEST = re.compile(
+    r"^.*references (?:are )?available (?:up)?on request.*$\n?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Any one of these is enough to treat extracted text as a resume: a common
+# section heading, an email address, or a phone number. Phones need a
+# leading "+country" code or grouped digits like "(020) 7946 0958" /
+# "555-123-4567", so dates and amounts don't count
+RESUME_SIGNALS = re.compile(
+    r"\b(?:experience|education|skills|summary|projects|certifications)\b"
+    r"|[^@\s]@[^@\s.]+\.[^@\s]"
+    r"|\+\d{1,3}[ .-]?\d[\d .-]{6,13}\d"
+    r"|(?:\(\d{2,5}\)|\b\d{3,5})[ .-]\d{3,4}[ .-]\d{3,4}\b",
+    re.IGNORECASE,
+)
+
+NOT_A_RESUME = "Document does not look like a resume"
+
+
+def _condense_resume_text(resume_text: str) -> str:
+    resume_text = NON_INFORMATIVE_SECTION.sub("", resume_text)
+    resume_text = REFERENCES_ON_REQUEST.sub("", resume_text)
+    # Bedrock latency and cost scale with input tokens
+    return resume_text.strip()[: settings.max_resume_chars]
+
+
+def looks_like_resume(resume_text: str) -> bool:
+    # Only look at as much text as the model would get anyway, so the scan
+    # stays bounded on very long uploads
+    return RESUME_SIGNALS.search(resume_text[: settings.max_resume_chars]) is not None
+
+
+PdfSource = Union[str, Path, bytes, bytearray]
+
+PDF_MAGIC = b"%PDF-"
+
+
+def load_pdf_bytes(pdf_source: PdfSource) -> Optional[bytes]:
+    """
+    Return the raw bytes of a PDF path or buffer, or None if it is not a PDF.
+    Checking the header up front keeps garbage away from the extractor, which
+    can be very slow on malformed streams.
+    """
+    if isinstance(pdf_source, (bytes, bytearray)):
+        pdf_bytes = bytes(pdf_source)
+    else:
+        path = Path(pdf_source)
+
+        if not path.exists() or path.suffix.lower() != ".pdf":
+            return None
+
+        pdf_bytes = path.read_bytes()
+
+    return pdf_bytes if pdf_bytes.startswith(PDF_MAGIC) else None
+
+
+def _open_pdf(pdf_source: PdfSource) -> pymupdf.Document:
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return pymupdf.open(stream=pdf_source, filetype="pdf")
+    return pymupdf.open(pdf_source)
+
+
+class PreparedResume(NamedTuple):
+    """Output of the local parse step; ``cached`` is set on a cache hit."""
+
+    digest: str
+    resume_text: str = ""
+    cached: Optional[ParsedResume] = None
+
 
 class BedrockResumeParser:
     """
@@ -17,64 +126,118 @@ class BedrockResumeParser:
     """
 
     def __init__(self):
-        bedrock_client = boto3.client(
+        bedrock_config = Config(
+            region_name=settings.aws_region,
+            max_pool_connections=32,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            tcp_keepalive=True,
+        )
+
+        self.bedrock_client = boto3.client(
             service_name="bedrock-runtime",
             region_name=settings.aws_region,
+            config=bedrock_config,
         )
 
         self.client = instructor.from_bedrock(
-            client=bedrock_client,
+            client=self.bedrock_client,
             mode=instructor.Mode.BEDROCK_TOOLS,
         )
 
         self.model_id = settings.bedrock_model_id
 
-    def extract_text_from_pdf(self, pdf_path: Union[str, Path]) -> str:
-        text = ""
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text.strip()
+        # Parsed resumes keyed by SHA-256 of the PDF bytes, least recently
+        # used first
+        self._cache: OrderedDict[str, ParsedResume] = OrderedDict()
+        self._cache_size = settings.parse_cache_size
+        self._cache_lock = threading.Lock()
 
-    def _create_prompt(self, resume_text: str) -> str:
-        return f"""
-You are a resume parsing assistant.
+    def _get_cached(self, digest: str) -> Optional[ParsedResume]:
+        with self._cache_lock:
+            parsed_resume = self._cache.get(digest)
+            if parsed_resume is not None:
+                self._cache.move_to_end(digest)
+            return parsed_resume
 
-Rules:
-- Be concise and factual
-- Do not infer missing information
-- Limit responsibilities to 3–5 bullets per role
-- Normalize skills and titles where possible
-- Do not add commentary
+    def _set_cached(self, digest: str, parsed_resume: ParsedResume) -> None:
+        if self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[digest] = parsed_resume
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
 
-Resume:
-{resume_text}
-""".strip()
+    def warm_up(self) -> None:
+        """
+        Open the HTTPS connection to the Bedrock runtime endpoint ahead of
+        the first parse request.
+        """
+        try:
+            self.bedrock_client.list_async_invokes(maxResults=1)
+        except Exception:
+            # Only the TLS handshake matters here, not the response
+            pass
 
-    def parse_resume(
-        self, pdf_path: Union[str, Path]
-    ) -> tuple[Optional[ParsedResume], Optional[str]]:
-        path = Path(pdf_path)
+    def extract_text_from_pdf(self, pdf_source: PdfSource) -> str:
+        # PyMuPDF is used over pdfplumber as we only need plain text, not
+        # table/layout reconstruction
+        with _open_pdf(pdf_source) as doc:
+            parts = [page.get_text("text", flags=TEXT_FLAGS) for page in doc]
+        return "\n".join(parts).strip()
 
-        if not path.exists() or path.suffix.lower() != ".pdf":
+    def _create_prompt(self, resume_text: str) -> str:
+        return PROMPT_HEADER + _condense_resume_text(resume_text)
+
+    def prepare_resume(
+        self, pdf_source: PdfSource
+    ) -> tuple[Optional[PreparedResume], Optional[str]]:
+        """
+        Local half of a parse: load, cache lookup, text extraction and the
+        resume pre-filter. Never calls Bedrock.
+        """
+        pdf_bytes = load_pdf_bytes(pdf_source)
+
+        if pdf_bytes is None:
             return None, "Invalid PDF file"
 
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        cached = self._get_cached(digest)
+        if cached is not None:
+            return PreparedResume(digest=digest, cached=cached), None
+
         try:
-            resume_text = self.extract_text_from_pdf(path)
+            resume_text = self.extract_text_from_pdf(pdf_bytes)
         except Exception as e:
             return None, f"PDF extraction failed: {str(e)}"
 
         if not resume_text or len(resume_text) < 20:
             return None, "Resume text is empty or too short"
 
-        prompt = self._create_prompt(resume_text)
+        # Cheap local check so obvious non-resumes never cost a Bedrock call
+        if not looks_like_resume(resume_text):
+            logger.info("Skipped Bedrock call for non-resume upload %s", digest)
+            return None, NOT_A_RESUME
+
+        return PreparedResume(digest=digest, resume_text=resume_text), None
+
+    def parse_prepared(
+        self, prepared: PreparedResume
+    ) -> tuple[Optional[ParsedResume], Optional[str]]:
+        """
+        Bedrock half of a parse. Callers are expected to bound how many of
+        these run at once.
+        """
+        if prepared.cached is not None:
+            return prepared.cached, None
+
+        prompt = self._create_prompt(prepared.resume_text)
 
         try:
             parsed_resume: ParsedResume = self.client.create(
                 model=self.model_id,
                 response_model=ParsedResume,
+                max_tokens=settings.max_output_tokens,
                 messages=[
                     {
                         "role": "system",
@@ -87,6 +250,7 @@ Resume:
                 ],
             )
 
+            self._set_cached(prepared.digest, parsed_resume)
             return parsed_resume, None
 
         except ValidationError as e:
@@ -94,3 +258,13 @@ Resume:
 
         except Exception as e:
             return None, f"Parsing failed: {str(e)}"
+
+    def parse_resume(
+        self, pdf_source: PdfSource
+    ) -> tuple[Optional[ParsedResume], Optional[str]]:
+        prepared, error = self.prepare_resume(pdf_source)
+
+        if error:
+            return None, error
+
+        return self.parse_prepared(prepared)
@@ -2,10 +2,6 @@ import pdfplumber
 from pathlib import Path
 
 def extract_text_from_pdf(path: Path) -> str:
-    text = ""
     with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
-    return text.strip()
+        parts = [page.extract_text() for page in pdf.pages]
+    return "\n".join(parts).strip()
@@ -1,7 +1,14 @@
 #!/bin/bash
 
-echo "Starting FastAPI..."
-uvicorn app.main:app --host 0.0.0.0 --port 8000 &
+API_WORKERS="${API_WORKERS:-$(nproc)}"
+
+echo "Starting FastAPI with ${API_WORKERS} workers..."
+uvicorn app.main:app --host 0.0.0.0 --port 8000 \
+  --workers "${API_WORKERS}" \
+  --loop uvloop \
+  --http httptools \
+  --limit-concurrency 256 \
+  --timeout-keep-alive 120 &
 
 sleep 3
 
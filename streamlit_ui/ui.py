@@ -1,10 +1,21 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-import tempfile
 
 API_URL = "http://localhost:8000/resume/parse"
 
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    # Shared across reruns so the API connection is kept alive between parses
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 st.set_page_config(
     page_title="Resume Parser",
     layout="wide",
@@ -23,19 +34,15 @@ if uploaded_file:
 
     if st.button("Parse Resume"):
         with st.spinner("Parsing resume..."):
-            with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
-                tmp.write(uploaded_file.read())
-                tmp.flush()
-
-                files = {
-                    "file": (
-                        uploaded_file.name,
-                        open(tmp.name, "rb"),
-                        "application/pdf",
-                    )
-                }
-
-                response = requests.post(API_URL, files=files)
+            files = {
+                "file": (
+                    uploaded_file.name,
+                    uploaded_file.getvalue(),
+                    "application/pdf",
+                )
+            }
+
+            response = get_session().post(API_URL, files=files, timeout=120)
 
         if response.status_code != 200:
             st.error(response.json().get("detail", "Parsing failed"))
@@ -0,0 +1,115 @@
+import pymupdf
+import pytest
+
+from app.core.config import settings
+from app.services.batch import BedrockBatchResumeParser
+from app.services.parser import BedrockResumeParser
+
+
+def _make_pdf(text: str) -> bytes:
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+class FakeS3:
+    def __init__(self, output: str = ""):
+        self.output = output
+        self.put_keys = []
+        self.deleted_keys = []
+
+    def put_object(self, Bucket, Key, Body):
+        self.put_keys.append(Key)
+
+    def delete_object(self, Bucket, Key):
+        self.deleted_keys.append(Key)
+
+    def get_object(self, Bucket, Key):
+        output = self.output
+
+        class Body:
+            def read(self):
+                return output.encode("utf-8")
+
+        return {"Body": Body()}
+
+
+class FakeBedrock:
+    def __init__(self, job=None):
+        self.job = job
+
+    def create_model_invocation_job(self, **kwargs):
+        raise RuntimeError("ValidationException: too few records")
+
+    def get_model_invocation_job(self, jobIdentifier):
+        return self.job
+
+
+@pytest.fixture
+def batch_parser(monkeypatch):
+    monkeypatch.setattr(settings, "batch_min_records", 2)
+    parser = BedrockBatchResumeParser(BedrockResumeParser())
+    parser.bucket = "bucket"
+    parser.role_arn = "arn:aws:iam::123456789012:role/batch"
+    return parser
+
+
+def _resumes(count: int):
+    pdf = _make_pdf("Jane Doe - Experience - Skills - Education")
+    return [(f"{i}.pdf", pdf) for i in range(count)]
+
+
+def test_submit_below_minimum_writes_nothing(batch_parser):
+    batch_parser.s3_client = FakeS3()
+
+    job, error = batch_parser.submit_batch(_resumes(1))
+
+    assert job is None
+    assert "at least 2" in error
+    assert batch_parser.s3_client.put_keys == []
+
+
+def test_failed_submission_deletes_manifest(batch_parser):
+    batch_parser.s3_client = FakeS3()
+    batch_parser.bedrock_client = FakeBedrock()
+
+    job, error = batch_parser.submit_batch(_resumes(2))
+
+    assert job is None
+    assert error.startswith("Batch submission failed")
+    assert batch_parser.s3_client.deleted_keys == batch_parser.s3_client.put_keys
+
+
+def test_bad_output_lines_become_record_errors(batch_parser):
+    batch_parser.s3_client = FakeS3(
+        output="\n".join(
+            [
+                "not json",
+                '{"modelOutput": {"content": []}}',
+                '{"recordId": "RES00000002", "modelOutput": {"content": ['
+                '{"type": "tool_use", "name": "ParsedResume",'
+                ' "input": {"full_name": "Jane Doe"}}]}}',
+            ]
+        )
+    )
+    batch_parser.bedrock_client = FakeBedrock(
+        job={
+            "status": "Completed",
+            "inputDataConfig": {
+                "s3InputDataConfig": {"s3Uri": "s3://bucket/in/job.jsonl"}
+            },
+            "outputDataConfig": {
+                "s3OutputDataConfig": {"s3Uri": "s3://bucket/out/"}
+            },
+        }
+    )
+
+    result, error = batch_parser.get_batch_result("job")
+
+    assert error is None
+    malformed, missing_id, parsed = result.results
+    assert malformed.record_id == "line-1"
+    assert malformed.error.startswith("Malformed output record")
+    assert missing_id.record_id == "line-2"
+    assert missing_id.error == "Model returned no tool call"
+    assert parsed.resume.full_name == "Jane Doe"
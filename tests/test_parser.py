@@ -0,0 +1,104 @@
+import hashlib
+import time
+
+import pymupdf
+
+from app.models.resume import ParsedResume
+from app.services.parser import (
+    NOT_A_RESUME,
+    BedrockResumeParser,
+    _condense_resume_text,
+    looks_like_resume,
+)
+
+
+def _make_pdf(text: str) -> bytes:
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+def test_references_block_stops_at_unlisted_heading():
+    text = (
+        "John Doe\n"
+        "REFERENCES\n"
+        "Available on request\n"
+        "Technical Skills\n"
+        "Python, Go\n"
+        "Work History\n"
+        "Acme 2019-2023\n"
+    )
+
+    condensed = _condense_resume_text(text)
+
+    assert "REFERENCES" not in condensed
+    assert "Technical Skills\nPython, Go" in condensed
+    assert "Work History\nAcme 2019-2023" in condensed
+
+
+def test_trailing_references_section_is_dropped():
+    text = (
+        "John Doe\n"
+        "Experience\n"
+        "Acme 2019-2023\n"
+        "References:\n"
+        "jane.smith@acme.com\n"
+        "+44 20 7946 0958\n"
+    )
+
+    assert _condense_resume_text(text) == "John Doe\nExperience\nAcme 2019-2023"
+
+
+def test_references_filter_is_linear_on_unspaced_lines():
+    # PyMuPDF can drop spaces, leaving long runs of letters on one line
+    text = "References\n" + "a" * 20000 + ".\nSkills\nPython"
+
+    start = time.perf_counter()
+    condensed = _condense_resume_text(text)
+
+    assert time.perf_counter() - start < 0.5
+    assert condensed.endswith("Skills\nPython")
+
+
+def test_cache_hit_is_resolved_in_the_prepare_step():
+    parser = BedrockResumeParser()
+    pdf_bytes = _make_pdf("Jane Doe - Experience - Skills")
+    cached = ParsedResume(full_name="Jane Doe")
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    parser._set_cached(digest, cached)
+
+    prepared, error = parser.prepare_resume(pdf_bytes)
+
+    assert error is None
+    assert prepared.digest == digest
+    assert prepared.cached == cached
+
+
+def test_dates_and_amounts_are_not_resume_signals():
+    assert not looks_like_resume("Invoice 2023-01-15 total 400")
+    assert not looks_like_resume("Order 2019-2023 ref 10482 qty 12")
+
+
+def test_contact_details_are_resume_signals():
+    assert looks_like_resume("Jane Doe +44 20 7946 0958")
+    assert looks_like_resume("Jane Doe +91 9035828125")
+    assert looks_like_resume("Jane Doe (020) 7946 0958")
+    assert looks_like_resume("Jane Doe 555-123-4567")
+    assert looks_like_resume("Jane Doe jane@example.com")
+
+
+def test_resume_signals_are_linear_on_unspaced_text():
+    for text in ("a" * 32000, "1-" * 8000, "a@" + "b" * 32000):
+        start = time.perf_counter()
+        assert not looks_like_resume(text)
+        assert time.perf_counter() - start < 0.5
+
+
+def test_non_resume_skips_bedrock(caplog):
+    parser = BedrockResumeParser()
+    pdf_bytes = _make_pdf("Invoice 2023-01-15 total 400 paid in full")
+
+    with caplog.at_level("INFO", logger="app"):
+        assert parser.parse_resume(pdf_bytes) == (None, NOT_A_RESUME)
+
+    assert "Skipped Bedrock call" in caplog.text
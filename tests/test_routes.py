@@ -0,0 +1,89 @@
+import asyncio
+import hashlib
+import threading
+import time
+
+import anyio.to_thread
+import pymupdf
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.core.config import settings
+from app.main import app
+from app.models.resume import ParsedResume
+
+
+def _make_pdf(text: str) -> bytes:
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+def _upload(name: str, pdf_bytes: bytes):
+    return ("files", (name, pdf_bytes, "application/pdf"))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(routes.parser_service, "warm_up", lambda: None)
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_parse_many_rejects_too_many_files(client, monkeypatch):
+    monkeypatch.setattr(settings, "parse_many_max_files", 2)
+    pdf_bytes = _make_pdf("Jane Doe - Experience - Skills")
+
+    response = client.post(
+        "/resume/parse_many",
+        files=[_upload(f"{i}.pdf", pdf_bytes) for i in range(3)],
+    )
+
+    assert response.status_code == 413
+
+
+def test_waiting_bedrock_calls_do_not_starve_other_requests(client, monkeypatch):
+    def slow_create(**kwargs):
+        time.sleep(0.2)
+        return ParsedResume(full_name="Jane Doe")
+
+    monkeypatch.setattr(routes.parser_service.client, "create", slow_create)
+    monkeypatch.setattr(routes, "bedrock_slots", asyncio.Semaphore(2))
+
+    # Shrink the threadpool so a queue of Bedrock waiters holding threads
+    # would exhaust it
+    def shrink_threadpool():
+        anyio.to_thread.current_default_thread_limiter().total_tokens = 4
+
+    client.portal.call(shrink_threadpool)
+
+    cached_pdf = _make_pdf("Cached Candidate - Experience - Skills")
+    routes.parser_service._set_cached(
+        hashlib.sha256(cached_pdf).hexdigest(), ParsedResume(full_name="Cached")
+    )
+
+    files = [
+        _upload(f"{i}.pdf", _make_pdf(f"Candidate {i} - Experience - Skills"))
+        for i in range(settings.parse_many_max_files)
+    ]
+    batch = threading.Thread(
+        target=client.post, args=("/resume/parse_many",), kwargs={"files": files}
+    )
+    batch.start()
+    time.sleep(0.3)
+
+    start = time.perf_counter()
+    assert client.get("/").status_code == 200
+    response = client.post(
+        "/resume/parse",
+        files={"file": ("cached.pdf", cached_pdf, "application/pdf")},
+    )
+    elapsed = time.perf_counter() - start
+
+    batch.join()
+
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Cached"
+    assert elapsed < 0.5